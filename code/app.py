@@ -2,7 +2,7 @@ import pandas as pd
 import streamlit as st
 
 from lib.config import initialize_ui
-from lib.data_loader import load_hospitals
+from lib.data_loader import load_hospital_store
 from lib.gui_drawer import (draw_main, draw_no_selection, draw_sidebar, draw_location_info, draw_hospital_info, draw_route_info)
 from lib.interaction_handler import process_user_interaction
 from lib.map_utils import render_initial_map
@@ -23,7 +23,7 @@ def main():
     
     # Load hospital location data with error handling
     try:
-        hospital_locations = load_hospitals()
+        hospital_locations = load_hospital_store()
     except (FileNotFoundError, pd.errors.EmptyDataError, Exception) as e:
         st.error(f"Failed to load hospital data: {str(e)}")
         return
@@ -0,0 +1,97 @@
+import argparse
+import time
+import tracemalloc
+from typing import Callable, Tuple
+
+import pandas as pd
+
+from lib.data_loader import ATTRIBUTE_COLUMNS, read_hospital_data
+from lib.hospital_store import HospitalStore
+from lib.utils import find_nearest_hospital, haversine
+
+def find_nearest_hospital_dataframe(user_loc: Tuple[float, float], df: pd.DataFrame) -> Tuple[str, float, Tuple[float, float]]:
+    """
+    Previous DataFrame-based nearest hospital lookup, kept here as the benchmark baseline.
+
+    Args:
+        user_loc: Tuple of user's (latitude, longitude) coordinates
+        df: DataFrame containing hospital location data
+
+    Returns:
+        Tuple of hospital name, distance in kilometers and hospital coordinates
+    """
+    distances = df.apply(
+        lambda row: haversine(user_loc[0], user_loc[1], row["Latitude"], row["Longitude"]),
+        axis=1
+    )
+    nearest_idx = distances.idxmin()
+    nearest_row = df.loc[nearest_idx]
+    return (nearest_row["Hospital Name"], distances[nearest_idx],
+            (nearest_row["Latitude"], nearest_row["Longitude"]))
+
+def measure_query(lookup: Callable, user_loc: Tuple[float, float], hospitals, repeats: int) -> Tuple[int, float]:
+    """
+    Measure the allocations and run time of a single nearest hospital query.
+
+    Args:
+        lookup: Nearest hospital lookup function
+        user_loc: Tuple of user's (latitude, longitude) coordinates
+        hospitals: Hospital data passed to the lookup
+        repeats: Number of timed runs to average over
+
+    Returns:
+        Tuple of peak bytes allocated during one query (tracemalloc) and mean time per query
+        in milliseconds
+    """
+    # Warm up once so lazy imports and caches are not counted
+    lookup(user_loc, hospitals)
+
+    tracemalloc.start()
+    lookup(user_loc, hospitals)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        lookup(user_loc, hospitals)
+    elapsed_ms = (time.perf_counter() - start) * 1000.0 / repeats
+
+    return peak, elapsed_ms
+
+def main():
+    """
+    Compare the DataFrame and HospitalStore representations of the hospital data.
+
+    Workflow:
+    1. Load hospital data into a HospitalStore
+    2. Build the equivalent DataFrame with the same columns
+    3. Report resident size of both representations
+    4. Report per-query peak allocations and run time of both lookups
+    """
+    parser = argparse.ArgumentParser(description="Benchmark DataFrame vs HospitalStore nearest hospital lookups.")
+    parser.add_argument("--hospital-file", default="data/us_hospital_locations.csv", help="Path to the hospital data CSV")
+    parser.add_argument("--lat", type=float, default=40.71, help="Query latitude")
+    parser.add_argument("--lon", type=float, default=-74.0, help="Query longitude")
+    parser.add_argument("--repeats", type=int, default=5, help="Timed runs per lookup")
+    args = parser.parse_args()
+
+    df = read_hospital_data(args.hospital_file)
+    attributes = [column for column in ATTRIBUTE_COLUMNS.values() if column in df.columns]
+    store = HospitalStore.from_dataframe(df, attributes)
+    display_df = store.to_dataframe()
+    user_loc = (args.lat, args.lon)
+
+    print(f"Hospitals:            {len(store)}")
+    print(f"DataFrame (deep):     {display_df.memory_usage(deep=True).sum() / 1e6:.2f} MB")
+    print(f"HospitalStore:        {store.nbytes / 1e6:.2f} MB")
+
+    for label, lookup, hospitals in (
+        ("DataFrame lookup", find_nearest_hospital_dataframe, display_df),
+        ("HospitalStore lookup", find_nearest_hospital, store)
+    ):
+        name, distance, _ = lookup(user_loc, hospitals)
+        peak, elapsed_ms = measure_query(lookup, user_loc, hospitals, args.repeats)
+        print(f"{label + ':':<22}{name} ({distance:.2f} km), peak {peak / 1e6:.2f} MB, {elapsed_ms:.2f} ms/query")
+
+if __name__ == "__main__":
+    main()
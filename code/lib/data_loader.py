@@ -4,6 +4,11 @@ import kagglehub
 from kagglehub import KaggleDatasetAdapter
 import streamlit as st
 
+from lib.hospital_store import HospitalStore
+
+# Optional raw columns kept as string attributes alongside name and coordinates
+ATTRIBUTE_COLUMNS = {"CITY": "City", "STATE": "State", "COUNTY": "County"}
+
 def check_local_file(hospital_file: str) -> pd.DataFrame | None:
     """
     Check for and load local hospital data file if it exists.
@@ -58,14 +63,16 @@ def clean_hospital_data(df: pd.DataFrame) -> pd.DataFrame:
         df: Raw hospital data DataFrame
     
     Returns:
-        Cleaned DataFrame with standardized columns
+        Cleaned DataFrame with standardized columns plus any available attribute columns
     
     Raises:
         pd.errors.EmptyDataError: If data is empty after cleaning
     """
     # Select and rename relevant columns
-    df = df[["NAME", "LATITUDE", "LONGITUDE"]].dropna()
-    df.columns = ["Hospital Name", "Latitude", "Longitude"]
+    df = df.dropna(subset=["NAME", "LATITUDE", "LONGITUDE"])
+    attributes = [column for column in ATTRIBUTE_COLUMNS if column in df.columns]
+    df = df[["NAME", "LATITUDE", "LONGITUDE", *attributes]].fillna({column: "" for column in attributes})
+    df.columns = ["Hospital Name", "Latitude", "Longitude", *(ATTRIBUTE_COLUMNS[column] for column in attributes)]
     
     # Validate we have data remaining
     if df.empty:
@@ -73,13 +80,12 @@ def clean_hospital_data(df: pd.DataFrame) -> pd.DataFrame:
     
     return df
 
-@st.cache_data
-def load_hospitals(hospital_file: str = "data/us_hospital_locations.csv") -> pd.DataFrame:
+def read_hospital_data(hospital_file: str) -> pd.DataFrame:
     """
-    Load hospital location data from local cache or Kaggle if not available.
+    Read and clean hospital location data from local cache or Kaggle if not available.
     
     Args:
-        hospital_file: Path to local hospital data file (default: "data/us_hospital_locations.csv")
+        hospital_file: Path to local hospital data file
     
     Returns:
         Cleaned DataFrame with hospital names and coordinates
@@ -107,4 +113,28 @@ def load_hospitals(hospital_file: str = "data/us_hospital_locations.csv") -> pd.
         raise pd.errors.EmptyDataError("Hospital data file is empty or contains no valid data.")
     
     except Exception as e:
-        raise Exception(f"Unexpected error while loading hospital data: {str(e)}")
\ No newline at end of file
+        raise Exception(f"Unexpected error while loading hospital data: {str(e)}")
+
+@st.cache_resource
+def load_hospital_store(hospital_file: str = "data/us_hospital_locations.csv") -> HospitalStore:
+    """
+    Load hospital data into a compact struct-of-arrays store for fast lookups.
+    
+    Args:
+        hospital_file: Path to local hospital data file (default: "data/us_hospital_locations.csv")
+    
+    Returns:
+        HospitalStore with coordinate arrays and packed name/attribute tables
+    
+    Raises:
+        FileNotFoundError: If data cannot be loaded from any source
+        pd.errors.EmptyDataError: If loaded data is empty
+        Exception: For unexpected errors during loading
+    
+    Note:
+        The cleaned DataFrame is only used to build the store and is not kept; use
+        HospitalStore.to_dataframe() when a DataFrame is needed for display
+    """
+    df = read_hospital_data(hospital_file)
+    attributes = [column for column in ATTRIBUTE_COLUMNS.values() if column in df.columns]
+    return HospitalStore.from_dataframe(df, attributes)
\ No newline at end of file
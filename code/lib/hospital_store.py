@@ -0,0 +1,138 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, Iterable, Tuple
+
+def _normalize_index(idx: int, length: int) -> int:
+    """Resolve a possibly negative index, raising IndexError if it is out of range"""
+    idx = int(idx)
+    if idx < 0:
+        idx += length
+    if not 0 <= idx < length:
+        raise IndexError("index out of range")
+    return idx
+
+class StringTable:
+    """
+    Packed table of strings stored as one UTF-8 buffer plus an offsets array.
+    """
+    __slots__ = ("_buffer", "_offsets")
+
+    def __init__(self, values: Iterable[str]):
+        encoded = [str(value).encode("utf-8") for value in values]
+        self._buffer = b"".join(encoded)
+        self._offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(value) for value in encoded], out=self._offsets[1:])
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, idx: int) -> str:
+        idx = _normalize_index(idx, len(self))
+        return self._buffer[self._offsets[idx]:self._offsets[idx + 1]].decode("utf-8")
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the buffer and offsets in bytes"""
+        return len(self._buffer) + self._offsets.nbytes
+
+class HospitalRecord:
+    """
+    Lightweight view of a single hospital inside a HospitalStore.
+
+    Fields are read from the store on access, so creating a record does not copy any data.
+    """
+    __slots__ = ("_store", "index")
+
+    def __init__(self, store: "HospitalStore", index: int):
+        self._store = store
+        self.index = index
+
+    @property
+    def name(self) -> str:
+        return self._store.names[self.index]
+
+    @property
+    def latitude(self) -> float:
+        return float(self._store.latitudes[self.index])
+
+    @property
+    def longitude(self) -> float:
+        return float(self._store.longitudes[self.index])
+
+    @property
+    def location(self) -> Tuple[float, float]:
+        return self.latitude, self.longitude
+
+    def attribute(self, column: str) -> str:
+        return self._store.attributes[column][self.index]
+
+    def __repr__(self) -> str:
+        return f"HospitalRecord({self.name!r}, {self.latitude:.5f}, {self.longitude:.5f})"
+
+class HospitalStore:
+    """
+    Struct-of-arrays store of hospital locations.
+
+    Coordinates are kept in contiguous float64 arrays and names/attributes in packed
+    string tables, so nearest-hospital lookups never touch pandas objects.
+    """
+    __slots__ = ("latitudes", "longitudes", "names", "attributes")
+
+    def __init__(
+        self,
+        latitudes: np.ndarray,
+        longitudes: np.ndarray,
+        names: StringTable,
+        attributes: Dict[str, StringTable]
+    ):
+        self.latitudes = np.ascontiguousarray(latitudes, dtype=np.float64)
+        self.longitudes = np.ascontiguousarray(longitudes, dtype=np.float64)
+        self.names = names
+        self.attributes = attributes
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame, attribute_columns: Iterable[str] = ()) -> "HospitalStore":
+        """
+        Build a store from a cleaned hospital DataFrame.
+
+        Args:
+            df: DataFrame with "Hospital Name", "Latitude" and "Longitude" columns
+            attribute_columns: Extra string columns to keep in the store
+
+        Returns:
+            HospitalStore holding the same hospitals in the same order
+        """
+        return cls(
+            df["Latitude"].to_numpy(),
+            df["Longitude"].to_numpy(),
+            StringTable(df["Hospital Name"]),
+            {column: StringTable(df[column]) for column in attribute_columns}
+        )
+
+    def __len__(self) -> int:
+        return len(self.latitudes)
+
+    def __getitem__(self, idx: int) -> HospitalRecord:
+        return HospitalRecord(self, _normalize_index(idx, len(self)))
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the coordinate arrays and string tables in bytes"""
+        return (self.latitudes.nbytes + self.longitudes.nbytes + self.names.nbytes
+                + sum(table.nbytes for table in self.attributes.values()))
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Build a pandas DataFrame of the stored hospitals for display.
+
+        Returns:
+            DataFrame with "Hospital Name", "Latitude", "Longitude" and attribute columns
+        """
+        data = {
+            "Hospital Name": [self.names[i] for i in range(len(self))],
+            "Latitude": self.latitudes,
+            "Longitude": self.longitudes
+        }
+        for column, table in self.attributes.items():
+            data[column] = [table[i] for i in range(len(self))]
+        return pd.DataFrame(data)
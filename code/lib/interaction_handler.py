@@ -1,19 +1,19 @@
-import pandas as pd
 from typing import Optional, Tuple
 
+from lib.hospital_store import HospitalStore
 from lib.route_service import get_best_route
 from lib.utils import find_nearest_hospital
 
 def process_user_interaction(
     folium_result: Optional[dict], 
-    hospital_locations: pd.DataFrame
+    hospital_locations: HospitalStore
 ) -> Optional[Tuple[Tuple[float, float], str, float, Tuple[float, float], Optional[dict], float, float]]:
     """
     Process user map interactions and coordinate route calculation.
     
     Args:
         folium_result: Folium interaction data containing click information
-        hospital_locations: DataFrame of hospital location data
+        hospital_locations: HospitalStore of hospital location data
     
     Returns:
         Tuple containing route information if valid interaction occurred:
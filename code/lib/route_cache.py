@@ -0,0 +1,374 @@
+import gzip
+import json
+import os
+import time
+from typing import Optional, Tuple
+
+import numpy as np
+import openrouteservice as ors
+import pandas as pd
+import requests
+import streamlit as st
+from openrouteservice import convert
+
+from lib.hospital_store import HospitalStore
+from lib.utils import find_nearest_hospital, haversine
+
+ROUTE_CACHE_FILE = "data/route_cache.json.gz"
+CACHE_RADIUS_KM = 2.0      # Only routes from seeds within this distance of a click are considered
+SNAP_DISTANCE_KM = 0.3     # Clicks must lie this close to a cached route to be served from it
+COORD_PRECISION = 5        # ~1 m resolution for stored coordinates
+MIN_SEED_DISTANCE_KM = 1.0 # Seeds closer than this to their nearest hospital are not warmed
+MIN_ROUTE_DISTANCE_KM = 0.05  # Shorter routes are degenerate and never stored or served
+
+# Transport failures that should count as a failed fetch instead of aborting the job
+FETCH_ERRORS = (
+    ors.exceptions.ApiError,
+    ors.exceptions.HTTPError,
+    ors.exceptions.Timeout,
+    requests.exceptions.RequestException
+)
+
+def county_seed_origins(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Derive one seed origin per county from the raw hospital dataset.
+
+    Args:
+        df: Raw hospital data DataFrame with COUNTY, COUNTYFIPS, STATE, LATITUDE and LONGITUDE columns
+
+    Returns:
+        DataFrame with "Seed ID", "Label", "Latitude" and "Longitude" columns, one row per county
+
+    Note:
+        In counties with a single hospital the seed sits on that hospital; precompute_routes()
+        skips such seeds via MIN_SEED_DISTANCE_KM
+
+    Raises:
+        ValueError: If the county columns are missing from the dataset
+    """
+    required_columns = {"COUNTY", "COUNTYFIPS", "STATE", "LATITUDE", "LONGITUDE"}
+    if not required_columns.issubset(df.columns):
+        raise ValueError("Hospital dataset has no county columns to derive seed origins from.")
+
+    # Drop rows without a usable FIPS code (e.g. "NOT AVAILABLE") so they don't form a fake county
+    df = df.dropna(subset=["COUNTYFIPS", "LATITUDE", "LONGITUDE"])
+    df = df[df["COUNTYFIPS"].astype(str).str.fullmatch(r"\d+")]
+
+    # Average hospital coordinates per county as the county centroid
+    counties = (
+        df.groupby("COUNTYFIPS")
+        .agg(County=("COUNTY", "first"), State=("STATE", "first"),
+             Latitude=("LATITUDE", "mean"), Longitude=("LONGITUDE", "mean"))
+        .reset_index()
+    )
+
+    return pd.DataFrame({
+        "Seed ID": "county:" + counties["COUNTYFIPS"].astype(str),
+        "Label": counties["County"].astype(str) + ", " + counties["State"].astype(str),
+        "Latitude": counties["Latitude"],
+        "Longitude": counties["Longitude"]
+    })
+
+def load_seed_file(seed_file: str) -> pd.DataFrame:
+    """
+    Load seed origins from a population-center CSV file.
+
+    Args:
+        seed_file: Path to a CSV file with Latitude/Longitude (or LATITUDE/LONGITUDE) and an optional Name column
+
+    Returns:
+        DataFrame with "Seed ID", "Label", "Latitude" and "Longitude" columns
+
+    Raises:
+        ValueError: If the file has no coordinate columns
+    """
+    df = pd.read_csv(seed_file)
+    df = df.rename(columns={"LATITUDE": "Latitude", "LONGITUDE": "Longitude", "NAME": "Name"})
+    if not {"Latitude", "Longitude"}.issubset(df.columns):
+        raise ValueError(f"Seed file {seed_file} must contain Latitude and Longitude columns.")
+
+    df = df.dropna(subset=["Latitude", "Longitude"])
+    labels = df["Name"].astype(str) if "Name" in df.columns else pd.Series("", index=df.index)
+
+    return pd.DataFrame({
+        "Seed ID": [f"point:{lat:.4f},{lon:.4f}" for lat, lon in zip(df["Latitude"], df["Longitude"])],
+        "Label": labels,
+        "Latitude": df["Latitude"],
+        "Longitude": df["Longitude"]
+    })
+
+def load_route_cache(cache_file: str = ROUTE_CACHE_FILE) -> dict:
+    """
+    Load the precomputed route cache from disk.
+
+    Args:
+        cache_file: Path to the gzip-compressed JSON route cache
+
+    Returns:
+        Dictionary mapping seed IDs to cached route entries (empty if no cache exists)
+    """
+    if not os.path.exists(cache_file):
+        return {}
+    with gzip.open(cache_file, "rt", encoding="utf-8") as f:
+        return json.load(f)
+
+def save_route_cache(cache: dict, cache_file: str = ROUTE_CACHE_FILE) -> int:
+    """
+    Write the route cache to disk as compact gzip-compressed JSON.
+
+    Args:
+        cache: Dictionary mapping seed IDs to cached route entries
+        cache_file: Destination path for the route cache
+
+    Returns:
+        Size of the written cache file in bytes
+    """
+    os.makedirs(os.path.dirname(cache_file) or ".", exist_ok=True)
+
+    # Write to a temporary file first so a running app never reads a partial cache
+    tmp_file = cache_file + ".tmp"
+    with gzip.open(tmp_file, "wt", encoding="utf-8") as f:
+        json.dump(cache, f, separators=(",", ":"))
+    os.replace(tmp_file, cache_file)
+
+    return os.path.getsize(cache_file)
+
+def fetch_route(client: ors.Client, origin: Tuple[float, float], destination: Tuple[float, float]) -> Optional[dict]:
+    """
+    Request a driving route from OpenRouteService and pack it into a cache entry.
+
+    Args:
+        client: OpenRouteService client
+        origin: Seed (latitude, longitude) coordinates
+        destination: Hospital (latitude, longitude) coordinates
+
+    Returns:
+        Cache entry with the encoded polyline, distance and duration, or None if no usable route was found
+
+    Raises:
+        ors.exceptions.ApiError: If OpenRouteService API request fails
+    """
+    # The JSON format returns the geometry as an encoded polyline, which is far smaller than GeoJSON
+    route = client.directions(
+        [origin[::-1], destination[::-1]],
+        profile="driving-car",
+        format="json"
+    )
+    if not route or not route.get("routes"):
+        return None
+
+    # Reject zero-length routes, which would be served as fake straight-line routes
+    summary = route["routes"][0].get("summary", {})
+    if summary.get("distance", 0) / 1000.0 < MIN_ROUTE_DISTANCE_KM:
+        return None
+
+    return {
+        "origin": [round(origin[0], COORD_PRECISION), round(origin[1], COORD_PRECISION)],
+        "hospital": [round(destination[0], COORD_PRECISION), round(destination[1], COORD_PRECISION)],
+        "geometry": route["routes"][0]["geometry"],
+        "distance_km": round(summary.get("distance", 0) / 1000.0, 3),
+        "duration_min": round(summary.get("duration", 0) / 60.0, 2)
+    }
+
+def precompute_routes(
+    seeds: pd.DataFrame,
+    hospitals: HospitalStore,
+    client: ors.Client,
+    cache_file: str = ROUTE_CACHE_FILE,
+    batch_size: int = 20,
+    pause: float = 60.0
+) -> dict:
+    """
+    Warm the route cache for a set of seed origins, skipping routes that are already cached.
+
+    Args:
+        seeds: DataFrame of seed origins from county_seed_origins() or load_seed_file()
+        hospitals: HospitalStore of hospital location data
+        client: OpenRouteService client
+        cache_file: Path to the route cache
+        batch_size: Number of API requests sent before pausing
+        pause: Seconds to wait between batches to respect the API rate limit
+
+    Returns:
+        Report dictionary with seed, skipped, cached, fetched and failed counts, coverage
+        of the eligible seeds and storage size
+
+    Raises:
+        ValueError: If batch_size is not positive or pause is negative
+    """
+    if batch_size <= 0 or pause < 0:
+        raise ValueError("batch_size must be positive and pause must not be negative.")
+
+    cache = load_route_cache(cache_file)
+
+    # Resolve the nearest hospital for each seed and keep only routes that still need fetching
+    pending = []
+    eligible = []
+    for seed_id, lat, lon in zip(seeds["Seed ID"], seeds["Latitude"], seeds["Longitude"]):
+        _, straight_dist, destination = find_nearest_hospital((lat, lon), hospitals)
+
+        # A seed sitting on its hospital would only yield a zero-length route
+        if straight_dist < MIN_SEED_DISTANCE_KM:
+            continue
+        eligible.append(seed_id)
+
+        entry = cache.get(seed_id)
+        hospital = [round(destination[0], COORD_PRECISION), round(destination[1], COORD_PRECISION)]
+        if entry is None or entry.get("hospital") != hospital:
+            pending.append((seed_id, (float(lat), float(lon)), destination))
+
+    fetched = failed = 0
+    for start in range(0, len(pending), batch_size):
+        if start:
+            time.sleep(pause)
+
+        for seed_id, origin, destination in pending[start:start + batch_size]:
+            try:
+                entry = fetch_route(client, origin, destination)
+            except FETCH_ERRORS:
+                entry = None
+
+            if entry is None:
+                failed += 1
+            else:
+                cache[seed_id] = entry
+                fetched += 1
+
+        # Persist after every batch so an interrupted run keeps its progress
+        save_route_cache(cache, cache_file)
+
+    covered = sum(seed_id in cache for seed_id in eligible)
+    return {
+        "seeds": len(seeds),
+        "skipped": len(seeds) - len(eligible),
+        "already_cached": len(eligible) - len(pending),
+        "fetched": fetched,
+        "failed": failed,
+        "coverage": covered / len(eligible) if eligible else 0.0,
+        "storage_bytes": os.path.getsize(cache_file) if os.path.exists(cache_file) else 0
+    }
+
+@st.cache_resource(max_entries=1)
+def get_route_index(cache_file: str, modified: float) -> Tuple[np.ndarray, np.ndarray, list]:
+    """
+    Build lookup arrays over the cached seed origins.
+
+    Args:
+        cache_file: Path to the route cache
+        modified: Modification time of the cache file, so a rewritten cache is reloaded
+
+    Returns:
+        Tuple of origin latitudes, origin longitudes and the matching cache entries
+
+    Note:
+        Incomplete entries and degenerate ones shorter than MIN_ROUTE_DISTANCE_KM are left out of the index
+    """
+    required_keys = {"origin", "hospital", "geometry", "distance_km", "duration_min"}
+    entries = [
+        entry for entry in load_route_cache(cache_file).values()
+        if required_keys.issubset(entry) and entry["distance_km"] >= MIN_ROUTE_DISTANCE_KM
+    ]
+    origins = np.array([entry["origin"] for entry in entries], dtype=float).reshape(-1, 2)
+    return origins[:, 0], origins[:, 1], entries
+
+def snap_to_route(user_location: Tuple[float, float], coordinates: list) -> Tuple[int, list, float]:
+    """
+    Project the user's location onto the nearest segment of a route polyline.
+
+    Args:
+        user_location: Tuple containing user's (latitude, longitude) coordinates
+        coordinates: Route coordinates as [longitude, latitude] pairs
+
+    Returns:
+        Tuple containing:
+        - Index of the segment the user snaps onto
+        - Snapped point as [longitude, latitude]
+        - Distance from the user to the snapped point in kilometers
+    """
+    # Project onto a local flat plane around the user, accurate enough at sub-kilometer scale
+    points = np.asarray(coordinates, dtype=float)
+    km_per_deg = np.radians(6371.0)
+    x = (points[:, 0] - user_location[1]) * km_per_deg * np.cos(np.radians(user_location[0]))
+    y = (points[:, 1] - user_location[0]) * km_per_deg
+
+    # Closest point on each segment to the user, who sits at the origin
+    dx, dy = np.diff(x), np.diff(y)
+    length_sq = dx ** 2 + dy ** 2
+    t = np.clip(-(x[:-1] * dx + y[:-1] * dy) / np.where(length_sq > 0, length_sq, 1.0), 0.0, 1.0)
+    snap_dist = np.hypot(x[:-1] + t * dx, y[:-1] + t * dy)
+
+    segment = int(np.argmin(snap_dist))
+    start, end = points[segment], points[segment + 1]
+    snapped = (start + t[segment] * (end - start)).tolist()
+
+    return segment, snapped, float(snap_dist[segment])
+
+def lookup_cached_route(
+    user_location: Tuple[float, float],
+    hospital_location: Tuple[float, float],
+    cache_file: str = ROUTE_CACHE_FILE,
+    radius_km: float = CACHE_RADIUS_KM
+) -> Optional[Tuple[dict, float, float]]:
+    """
+    Serve a route from the precomputed cache if the user lies on a warmed route near its seed origin.
+
+    Args:
+        user_location: Tuple containing user's (latitude, longitude) coordinates
+        hospital_location: Tuple containing hospital's (latitude, longitude) coordinates
+        cache_file: Path to the route cache
+        radius_km: Maximum distance between the user and a seed origin of candidate routes
+
+    Returns:
+        Tuple of route geometry (GeoJSON format), driving distance (km) and duration (min),
+        or None if no cached route applies or the cache cannot be read
+
+    Note:
+        The user is snapped onto the cached polyline and the route is trimmed from that point;
+        routes more than SNAP_DISTANCE_KM away from the user are never served
+    """
+    if not os.path.exists(cache_file):
+        return None
+
+    # A corrupt or truncated cache falls back to a live request instead of failing the click
+    try:
+        origin_lats, origin_lons, entries = get_route_index(cache_file, os.path.getmtime(cache_file))
+    except (OSError, EOFError, ValueError, KeyError, TypeError):
+        return None
+    if not entries:
+        return None
+
+    # Only consider nearby seeds whose cached route ends at the requested hospital
+    hospital = [round(hospital_location[0], COORD_PRECISION), round(hospital_location[1], COORD_PRECISION)]
+    distances = haversine(user_location[0], user_location[1], origin_lats, origin_lons)
+    for idx in np.argsort(distances):
+        if distances[idx] > radius_km:
+            return None
+        entry = entries[idx]
+        if entry["hospital"] != hospital:
+            continue
+
+        try:
+            coordinates = convert.decode_polyline(entry["geometry"])["coordinates"]
+        except (ValueError, IndexError, TypeError):
+            continue
+        if len(coordinates) < 2:
+            continue
+
+        # Serve only if the user is on the route, so it is never extended by a detour to the seed
+        segment, snapped, snap_km = snap_to_route(user_location, coordinates)
+        if snap_km > SNAP_DISTANCE_KM:
+            continue
+
+        # Scale the cached road distance and duration by the share of the polyline still ahead
+        points = np.asarray(coordinates, dtype=float)
+        legs = haversine(points[:-1, 1], points[:-1, 0], points[1:, 1], points[1:, 0])
+        first_leg = haversine(snapped[1], snapped[0], points[segment + 1, 1], points[segment + 1, 0])
+        remaining = first_leg + legs[segment + 1:].sum()
+        share = remaining / legs.sum() if legs.sum() > 0 else 0.0
+        if entry["distance_km"] * share < MIN_ROUTE_DISTANCE_KM:
+            continue
+
+        geometry = {"type": "LineString", "coordinates": [snapped] + coordinates[segment + 1:]}
+        return geometry, float(entry["distance_km"] * share), float(entry["duration_min"] * share)
+
+    return None
@@ -5,6 +5,8 @@ import openrouteservice as ors
 import streamlit as st
 from dotenv import load_dotenv
 
+from lib.route_cache import lookup_cached_route
+
 # Load environment variables and initialize OpenRouteService client
 load_dotenv()
 client = ors.Client(key=os.getenv("API_KEY"))
@@ -13,6 +15,8 @@ def get_best_route(user_location: Tuple[float, float], hospital_location: Tuple[
     """
     Calculate the optimal driving route between user and hospital locations using OpenRouteService API.
     
+    Routes near origins warmed by precompute_routes.py are served from the local route cache.
+    
     Args:
         user_location: Tuple containing user's (latitude, longitude) coordinates
         hospital_location: Tuple containing hospital's (latitude, longitude) coordinates
@@ -27,6 +31,11 @@ def get_best_route(user_location: Tuple[float, float], hospital_location: Tuple[
         ors.exceptions.ApiError: If OpenRouteService API request fails
         Exception: For unexpected errors during route calculation
     """
+    # Serve from the precomputed route cache when the user is near a warmed origin
+    cached = lookup_cached_route(user_location, hospital_location)
+    if cached is not None:
+        return cached
+
     try:
         # Convert coordinates to OpenRouteService format (longitude, latitude)
         coords = [user_location[::-1], hospital_location[::-1]]
@@ -1,7 +1,8 @@
 import numpy as np
-import pandas as pd
 from typing import Tuple
 
+from lib.hospital_store import HospitalStore
+
 def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
     Calculate the great-circle distance between two points on Earth using the Haversine formula.
@@ -33,13 +34,13 @@ def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     
     return EARTH_RADIUS * c
 
-def find_nearest_hospital(user_loc: Tuple[float, float], df: pd.DataFrame) -> Tuple[str, float, Tuple[float, float]]:
+def find_nearest_hospital(user_loc: Tuple[float, float], hospitals: HospitalStore) -> Tuple[str, float, Tuple[float, float]]:
     """
     Identify the nearest hospital to the user's location.
     
     Args:
         user_loc: Tuple of user's (latitude, longitude) coordinates
-        df: DataFrame containing hospital location data
+        hospitals: HospitalStore containing hospital location data
     
     Returns:
         Tuple containing:
@@ -48,22 +49,17 @@ def find_nearest_hospital(user_loc: Tuple[float, float], df: pd.DataFrame) -> Tu
         - Hospital coordinates (latitude, longitude)
     
     Raises:
-        ValueError: If input DataFrame is invalid or missing required columns
+        ValueError: If the hospital store is empty
     """
-    # Validate input DataFrame
-    required_columns = {"Latitude", "Longitude", "Hospital Name"}
-    if df.empty or not required_columns.issubset(df.columns):
-        raise ValueError("Invalid hospital DataFrame: Missing required columns or empty.")
+    # Validate input store
+    if len(hospitals) == 0:
+        raise ValueError("Invalid hospital store: No hospitals loaded.")
     
-    # Calculate distances to all hospitals
-    distances = df.apply(
-        lambda row: haversine(user_loc[0], user_loc[1], row["Latitude"], row["Longitude"]), 
-        axis=1
-    )
+    # Calculate distances to all hospitals in one vectorized pass
+    distances = haversine(user_loc[0], user_loc[1], hospitals.latitudes, hospitals.longitudes)
     
     # Find nearest hospital
-    nearest_idx = distances.idxmin()
-    nearest_row = df.loc[nearest_idx]
+    nearest_idx = int(np.argmin(distances))
+    nearest = hospitals[nearest_idx]
     
-    return (nearest_row["Hospital Name"], distances[nearest_idx], 
-            (nearest_row["Latitude"], nearest_row["Longitude"]))
\ No newline at end of file
+    return nearest.name, float(distances[nearest_idx]), nearest.location
\ No newline at end of file
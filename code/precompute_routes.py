@@ -0,0 +1,59 @@
+import argparse
+
+from lib.data_loader import check_local_file, clean_hospital_data, download_from_kaggle
+from lib.hospital_store import HospitalStore
+from lib.route_cache import ROUTE_CACHE_FILE, county_seed_origins, load_seed_file, precompute_routes
+from lib.route_service import client
+
+def main():
+    """
+    Offline job that warms the route cache for seed origins.
+
+    Workflow:
+    1. Load raw hospital data
+    2. Derive seed origins from county centroids or a population-center file
+    3. Fetch missing routes in rate-limited batches
+    4. Report coverage and storage size
+    """
+    parser = argparse.ArgumentParser(description="Precompute driving routes from seed origins to their nearest hospitals.")
+    parser.add_argument("--hospital-file", default="data/us_hospital_locations.csv", help="Path to the hospital data CSV")
+    parser.add_argument("--seed-file", help="CSV of population centers with Latitude/Longitude columns (default: county centroids)")
+    parser.add_argument("--cache-file", default=ROUTE_CACHE_FILE, help="Path to the route cache")
+    parser.add_argument("--batch-size", type=int, default=20, help="API requests per batch")
+    parser.add_argument("--pause", type=float, default=60.0, help="Seconds to wait between batches")
+    parser.add_argument("--limit", type=int, help="Only warm the first N seed origins")
+    args = parser.parse_args()
+    if args.batch_size <= 0:
+        parser.error("--batch-size must be a positive integer")
+    if args.pause < 0:
+        parser.error("--pause must not be negative")
+
+    # Load raw data, which still carries the county columns
+    raw = check_local_file(args.hospital_file)
+    if raw is None:
+        raw = download_from_kaggle(args.hospital_file)
+    hospitals = HospitalStore.from_dataframe(clean_hospital_data(raw))
+
+    seeds = load_seed_file(args.seed_file) if args.seed_file else county_seed_origins(raw)
+    if args.limit is not None:
+        seeds = seeds.head(args.limit)
+
+    report = precompute_routes(
+        seeds,
+        hospitals,
+        client,
+        cache_file=args.cache_file,
+        batch_size=args.batch_size,
+        pause=args.pause
+    )
+
+    print(f"Seed origins:    {report['seeds']}")
+    print(f"Skipped:         {report['skipped']}")
+    print(f"Already cached:  {report['already_cached']}")
+    print(f"Fetched:         {report['fetched']}")
+    print(f"Failed:          {report['failed']}")
+    print(f"Coverage:        {report['coverage']:.1%}")
+    print(f"Storage size:    {report['storage_bytes'] / 1024:.1f} KiB")
+
+if __name__ == "__main__":
+    main()